@@ -32,9 +32,11 @@ function initializeProviders(): ProviderConfig {
   try {
     const openaiApiKey = openAIKey();
     if (openaiApiKey && openaiApiKey.trim() !== "") {
+      // One client per API key, shared by every model of this vendor
+      const openaiClient = createOpenAI({ apiKey: openaiApiKey });
       providers.push({
         name: "OpenAI",
-        client: createOpenAI({ apiKey: openaiApiKey }),
+        client: openaiClient,
         model: "gpt-4o",
         costPerToken: 0.015, // $15 per 1M tokens
         maxTokens: 4096,
@@ -43,7 +45,7 @@ function initializeProviders(): ProviderConfig {
       });
       providers.push({
         name: "OpenAI-Mini",
-        client: createOpenAI({ apiKey: openaiApiKey }),
+        client: openaiClient,
         model: "gpt-4o-mini",
         costPerToken: 0.0015, // $1.5 per 1M tokens
         maxTokens: 16384,
@@ -59,9 +61,10 @@ function initializeProviders(): ProviderConfig {
   try {
     const anthropicApiKey = anthropicKey();
     if (anthropicApiKey && anthropicApiKey.trim() !== "") {
+      const anthropicClient = createAnthropic({ apiKey: anthropicApiKey });
       providers.push({
         name: "Anthropic",
-        client: createAnthropic({ apiKey: anthropicApiKey }),
+        client: anthropicClient,
         model: "claude-3-5-sonnet-20241022",
         costPerToken: 0.015, // $15 per 1M tokens
         maxTokens: 8192,
@@ -70,7 +73,7 @@ function initializeProviders(): ProviderConfig {
       });
       providers.push({
         name: "Anthropic-Haiku",
-        client: createAnthropic({ apiKey: anthropicApiKey }),
+        client: anthropicClient,
         model: "claude-3-5-haiku-20241022",
         costPerToken: 0.001, // $1 per 1M tokens
         maxTokens: 8192,
@@ -86,9 +89,10 @@ function initializeProviders(): ProviderConfig {
   try {
     const googleApiKey = googleKey();
     if (googleApiKey && googleApiKey.trim() !== "") {
+      const googleClient = createGoogleGenerativeAI({ apiKey: googleApiKey });
       providers.push({
         name: "Google",
-        client: createGoogleGenerativeAI({ apiKey: googleApiKey }),
+        client: googleClient,
         model: "gemini-1.5-pro",
         costPerToken: 0.0035, // $3.5 per 1M tokens
         maxTokens: 8192,
@@ -97,7 +101,7 @@ function initializeProviders(): ProviderConfig {
       });
       providers.push({
         name: "Google-Flash",
-        client: createGoogleGenerativeAI({ apiKey: googleApiKey }),
+        client: googleClient,
         model: "gemini-1.5-flash",
         costPerToken: 0.000375, // $0.375 per 1M tokens
         maxTokens: 8192,
@@ -131,8 +135,11 @@ export class AIProviderManager {
   constructor() {
     this.providers = initializeProviders();
     this.providerStats = new Map();
-    
-    // Initialize stats for each provider
+    this.initializeProviderStats();
+  }
+
+  // Initialize stats for any provider that doesn't have them yet
+  private initializeProviderStats(): void {
     [...this.providers.individual, ...this.providers.batch].forEach(provider => {
       if (!this.providerStats.has(provider.name)) {
         this.providerStats.set(provider.name, { successes: 0, failures: 0, totalCost: 0 });
@@ -324,11 +331,15 @@ export class AIProviderManager {
     totalCost: number;
     costPerToken: number;
   }> {
-    const allProviders = [...this.providers.individual, ...this.providers.batch];
-    const uniqueProviders = Array.from(new Set(allProviders.map(p => p.name)))
-      .map(name => allProviders.find(p => p.name === name)!);
+    // Index by name so each provider is kept once (first occurrence wins)
+    const providersByName = new Map<string, AIProvider>();
+    for (const provider of [...this.providers.individual, ...this.providers.batch]) {
+      if (!providersByName.has(provider.name)) {
+        providersByName.set(provider.name, provider);
+      }
+    }
 
-    return uniqueProviders.map(provider => {
+    return Array.from(providersByName.values()).map(provider => {
       const stats = this.providerStats.get(provider.name) || { successes: 0, failures: 0, totalCost: 0 };
       const totalRequests = stats.successes + stats.failures;
       const successRate = totalRequests > 0 ? stats.successes / totalRequests : 0;
@@ -360,6 +371,7 @@ export class AIProviderManager {
   // Refresh provider configuration (useful for detecting new API keys)
   refreshProviders(): void {
     this.providers = initializeProviders();
+    this.initializeProviderStats();
     console.log("AI providers refreshed");
   }
 }
@@ -54,12 +54,7 @@ export const analyze = api<AnalyzeRequest, AnalyzeResponse>(
 
     try {
       const issues = await analyzeHTML(htmlContent);
-      const summary = {
-        total: issues.length,
-        high: issues.filter(i => i.severity === "high").length,
-        medium: issues.filter(i => i.severity === "medium").length,
-        low: issues.filter(i => i.severity === "low").length,
-      };
+      const summary = summarizeIssues(issues);
 
       return { issues, summary };
     } catch (error) {
@@ -69,6 +64,18 @@ export const analyze = api<AnalyzeRequest, AnalyzeResponse>(
   }
 );
 
+// Counts issues by severity in a single pass over the list
+export function summarizeIssues(issues: AccessibilityIssue[]): AnalyzeResponse["summary"] {
+  const summary = { total: issues.length, high: 0, medium: 0, low: 0 };
+  for (const issue of issues) {
+    summary[issue.severity]++;
+  }
+  return summary;
+}
+
+// Link texts that don't describe their destination
+const NON_DESCRIPTIVE_LINK_TEXTS = new Set(['click here', 'read more', 'here', 'more', 'link']);
+
 export async function analyzeHTML(html: string): Promise<AccessibilityIssue[]> {
   let $: cheerio.CheerioAPI;
   
@@ -104,8 +111,7 @@ export async function analyzeHTML(html: string): Promise<AccessibilityIssue[]> {
     const text = $link.text().trim().toLowerCase();
     const href = $link.attr('href') || '';
     
-    const nonDescriptiveTexts = ['click here', 'read more', 'here', 'more', 'link'];
-    if (nonDescriptiveTexts.includes(text) || text.length < 3) {
+    if (NON_DESCRIPTIVE_LINK_TEXTS.has(text) || text.length < 3) {
       issues.push({
         type: "non-descriptive-link",
         severity: "medium",
@@ -97,34 +97,28 @@ export async function getCacheStats(): Promise<{
   const last24h = new Date(now.getTime() - 24 * 60 * 60 * 1000);
   const last7d = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000);
 
-  const totalResult = await cacheDB.queryRow<{ count: string }>`
-    SELECT COUNT(*) as count FROM ai_fixes
-  `;
-
-  const recent24hResult = await cacheDB.queryRow<{ count: string }>`
-    SELECT COUNT(*) as count FROM ai_fixes WHERE created_at > ${last24h}
-  `;
-
-  const recent7dResult = await cacheDB.queryRow<{ count: string }>`
-    SELECT COUNT(*) as count FROM ai_fixes WHERE created_at > ${last7d}
-  `;
-
-  const dateRangeResult = await cacheDB.queryRow<{ 
-    oldest: Date | null; 
+  const statsResult = await cacheDB.queryRow<{
+    total_entries: string;
+    entries_last_24h: string;
+    entries_last_7d: string;
+    oldest: Date | null;
     newest: Date | null;
   }>`
     SELECT 
+      COUNT(*) as total_entries,
+      COUNT(*) FILTER (WHERE created_at > ${last24h}) as entries_last_24h,
+      COUNT(*) FILTER (WHERE created_at > ${last7d}) as entries_last_7d,
       MIN(created_at) as oldest,
       MAX(created_at) as newest
     FROM ai_fixes
   `;
 
   return {
-    totalEntries: parseInt(totalResult?.count || '0'),
-    entriesLast24h: parseInt(recent24hResult?.count || '0'),
-    entriesLast7d: parseInt(recent7dResult?.count || '0'),
-    oldestEntry: dateRangeResult?.oldest || null,
-    newestEntry: dateRangeResult?.newest || null,
+    totalEntries: parseInt(statsResult?.total_entries || '0'),
+    entriesLast24h: parseInt(statsResult?.entries_last_24h || '0'),
+    entriesLast7d: parseInt(statsResult?.entries_last_7d || '0'),
+    oldestEntry: statsResult?.oldest || null,
+    newestEntry: statsResult?.newest || null,
   };
 }
 
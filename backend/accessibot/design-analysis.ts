@@ -1,6 +1,7 @@
 import { api, APIError } from "encore.dev/api";
 import { secret } from "encore.dev/config";
 import { enhanceIssuesWithAI } from "./ai-service";
+import { summarizeIssues } from "./analyze";
 import type { AccessibilityIssue } from "./analyze";
 
 const figmaToken = secret("FigmaToken");
@@ -135,13 +136,14 @@ export const analyzeDesignFile = api<DesignAnalyzeRequest, DesignAnalyzeResponse
       }
 
       const summary = {
-        total: issues.length,
-        high: issues.filter(i => i.severity === "high").length,
-        medium: issues.filter(i => i.severity === "medium").length,
-        low: issues.filter(i => i.severity === "low").length,
-        colorContrastIssues: issues.filter(i => i.colorContrast).length,
-        componentIssues: issues.filter(i => i.type.includes('component')).length,
+        ...summarizeIssues(issues),
+        colorContrastIssues: 0,
+        componentIssues: 0,
       };
+      for (const issue of issues) {
+        if (issue.colorContrast) summary.colorContrastIssues++;
+        if (issue.type.includes('component')) summary.componentIssues++;
+      }
 
       return { 
         issues, 
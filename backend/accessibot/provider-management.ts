@@ -26,9 +26,14 @@ export const getProviderStatsEndpoint = api<void, ProviderStatsResponse>(
   async () => {
     const providers = getProviderStats();
     
-    const totalCost = providers.reduce((sum, p) => sum + p.totalCost, 0);
-    const totalRequests = providers.reduce((sum, p) => sum + p.totalRequests, 0);
-    const totalSuccesses = providers.reduce((sum, p) => sum + (p.totalRequests * p.successRate), 0);
+    let totalCost = 0;
+    let totalRequests = 0;
+    let totalSuccesses = 0;
+    for (const p of providers) {
+      totalCost += p.totalCost;
+      totalRequests += p.totalRequests;
+      totalSuccesses += p.totalRequests * p.successRate;
+    }
     const overallSuccessRate = totalRequests > 0 ? totalSuccesses / totalRequests : 0;
 
     return {
@@ -75,6 +75,12 @@ export interface PriorityBatchItem<T> {
   addedAt: number;
 }
 
+// Queue entry carrying its own promise callbacks alongside the item
+interface QueuedBatchItem<T, R> extends PriorityBatchItem<T> {
+  resolve: (value: R) => void;
+  reject: (error: Error) => void;
+}
+
 export interface BatchProcessorStats {
   totalProcessed: number;
   totalErrors: number;
@@ -97,20 +103,16 @@ export interface BatchProcessorConfig {
 
 // Enhanced batch processing with dynamic sizing and priority queuing
 export class BatchProcessor<T, R> {
-  private queue: PriorityBatchItem<T>[] = [];
+  private queue: QueuedBatchItem<T, R>[] = [];
   private currentBatchSize: number;
   private currentDelayMs: number;
   private processor: (items: T[]) => Promise<R[]>;
   private timeoutId: NodeJS.Timeout | null = null;
-  private resolvers: Array<{
-    resolve: (value: R) => void;
-    reject: (error: Error) => void;
-    priority: number;
-  }> = [];
   
   // Performance tracking
   private stats: BatchProcessorStats;
   private responseTimes: number[] = [];
+  private responseTimeSum: number = 0;
   private batchCount: number = 0;
   private config: BatchProcessorConfig;
 
@@ -134,22 +136,15 @@ export class BatchProcessor<T, R> {
   async add(item: T, priority: number = 0): Promise<R> {
     return new Promise<R>((resolve, reject) => {
       // Insert item in priority order (higher priority first)
-      const priorityItem: PriorityBatchItem<T> = {
+      const priorityItem: QueuedBatchItem<T, R> = {
         item,
         priority,
         addedAt: Date.now(),
+        resolve,
+        reject,
       };
 
-      // Find insertion point to maintain priority order
-      let insertIndex = 0;
-      while (insertIndex < this.queue.length && this.queue[insertIndex].priority >= priority) {
-        insertIndex++;
-      }
-
-      this.queue.splice(insertIndex, 0, priorityItem);
-      
-      // Insert resolver at the same position
-      this.resolvers.splice(insertIndex, 0, { resolve, reject, priority });
+      this.queue.splice(this.findInsertIndex(priority), 0, priorityItem);
 
       // Process immediately if batch is full
       if (this.queue.length >= this.currentBatchSize) {
@@ -165,12 +160,27 @@ export class BatchProcessor<T, R> {
     });
   }
 
+  // Binary search for the insertion point that keeps the queue sorted by
+  // descending priority, placing the new item after existing items of equal priority
+  private findInsertIndex(priority: number): number {
+    let low = 0;
+    let high = this.queue.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.queue[mid].priority >= priority) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+
   private async processBatch(): Promise<void> {
     if (this.queue.length === 0) return;
 
     const batchSize = Math.min(this.currentBatchSize, this.queue.length);
     const currentBatch = this.queue.splice(0, batchSize);
-    const currentResolvers = this.resolvers.splice(0, batchSize);
 
     if (this.timeoutId) {
       clearTimeout(this.timeoutId);
@@ -190,11 +200,11 @@ export class BatchProcessor<T, R> {
       // Update stats
       this.updateStats(responseTime, false);
       
-      for (let i = 0; i < currentResolvers.length; i++) {
+      for (let i = 0; i < currentBatch.length; i++) {
         if (results[i] !== undefined) {
-          currentResolvers[i].resolve(results[i]);
+          currentBatch[i].resolve(results[i]);
         } else {
-          currentResolvers[i].reject(new Error('No result for batch item'));
+          currentBatch[i].reject(new Error('No result for batch item'));
         }
       }
     } catch (error) {
@@ -203,8 +213,8 @@ export class BatchProcessor<T, R> {
       this.updateStats(responseTime, true);
       
       // Reject all pending requests in this batch
-      for (const resolver of currentResolvers) {
-        resolver.reject(error instanceof Error ? error : new Error(String(error)));
+      for (const entry of currentBatch) {
+        entry.reject(error instanceof Error ? error : new Error(String(error)));
       }
     }
 
@@ -229,13 +239,14 @@ export class BatchProcessor<T, R> {
       this.stats.totalErrors++;
     }
 
-    // Keep only last 10 response times for rolling average
+    // Keep only last 10 response times for rolling average, tracking their sum incrementally
     this.responseTimes.push(responseTime);
+    this.responseTimeSum += responseTime;
     if (this.responseTimes.length > 10) {
-      this.responseTimes.shift();
+      this.responseTimeSum -= this.responseTimes.shift()!;
     }
 
-    this.stats.averageResponseTime = this.responseTimes.reduce((a, b) => a + b, 0) / this.responseTimes.length;
+    this.stats.averageResponseTime = this.responseTimeSum / this.responseTimes.length;
     this.stats.currentBatchSize = this.currentBatchSize;
     this.stats.errorRate = this.stats.totalErrors / this.stats.totalProcessed;
   }
@@ -1,6 +1,6 @@
 import { Subscription } from "encore.dev/pubsub";
 import { accessibilityAnalysisTopic, AccessibilityAnalysisRequest } from "./webhook";
-import { analyzeHTML, AccessibilityIssue } from "./analyze";
+import { analyzeHTML, summarizeIssues, AccessibilityIssue } from "./analyze";
 import { enhanceIssuesWithAI } from "./ai-service";
 import { createPullRequest } from "./github";
 import { SQLDatabase } from "encore.dev/storage/sqldb";
@@ -82,9 +82,11 @@ new Subscription(accessibilityAnalysisTopic, "process-accessibility-analysis", {
       }
 
       // Calculate issue counts by severity
-      const highSeverityCount = allIssues.filter(i => i.severity === "high").length;
-      const mediumSeverityCount = allIssues.filter(i => i.severity === "medium").length;
-      const lowSeverityCount = allIssues.filter(i => i.severity === "low").length;
+      const {
+        high: highSeverityCount,
+        medium: mediumSeverityCount,
+        low: lowSeverityCount,
+      } = summarizeIssues(allIssues);
 
       let pullRequestUrl: string | undefined;
       let pullRequestCreated = false;
@@ -125,21 +125,22 @@ function validateGitHubSignature(payload: string, signature: string): boolean {
   }
 }
 
+// File extensions and paths that commonly hold HTML/accessibility content
+const RELEVANT_EXTENSIONS = ['.html', '.htm', '.jsx', '.tsx', '.vue', '.svelte', '.php', '.asp', '.aspx', '.jsp'];
+const RELEVANT_PATHS = ['templates/', 'views/', 'components/', 'pages/', 'public/'];
+
 // Filters files that might contain HTML/accessibility content
 function getRelevantFiles(files: string[]): string[] {
-  const relevantExtensions = ['.html', '.htm', '.jsx', '.tsx', '.vue', '.svelte', '.php', '.asp', '.aspx', '.jsp'];
-  const relevantPaths = ['templates/', 'views/', 'components/', 'pages/', 'public/'];
-  
   return files.filter(file => {
     const lowerFile = file.toLowerCase();
     
     // Check file extensions
-    if (relevantExtensions.some(ext => lowerFile.endsWith(ext))) {
+    if (RELEVANT_EXTENSIONS.some(ext => lowerFile.endsWith(ext))) {
       return true;
     }
     
     // Check common paths for web content
-    if (relevantPaths.some(path => lowerFile.includes(path))) {
+    if (RELEVANT_PATHS.some(path => lowerFile.includes(path))) {
       return true;
     }
     
@@ -155,9 +156,8 @@ export const githubWebhook = api<GitHubWebhookPayload, WebhookResponse, WebhookH
     
     console.log(`Received GitHub webhook: ${event} (${webhookId})`);
 
-    // Validate signature for security
-    const payloadString = JSON.stringify(payload);
-    if (signature && !validateGitHubSignature(payloadString, signature)) {
+    // Validate signature for security (only re-serialize the payload when there is one to check)
+    if (signature && !validateGitHubSignature(JSON.stringify(payload), signature)) {
       console.error(`Invalid webhook signature for delivery ${webhookId}`);
       throw APIError.unauthenticated("Invalid webhook signature");
     }